@@ -6,23 +6,38 @@ Provides tools for customer management, contract operations, subscription handli
 """
 
 import os
+import time
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
-from datetime import datetime, timedelta
-import json
+import threading
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Generator, List, Optional, Tuple, Union
+from datetime import datetime, timezone
 
 import httpx
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
-from authlib.integrations.httpx_client import OAuth2Client
-from authlib.oauth2.rfc6749 import OAuth2Token
+
+# Use orjson when available, falling back to the standard library
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
-
-# Create FastMCP instance
-mcp = FastMCP("Frisbii Transform")
+# httpx logs every request at INFO; keep only its warnings and errors
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # API Configuration
 API_BASE_URL = os.getenv("FRISBII_BASE_URL", "https://sandbox.billwerk.com")
@@ -36,6 +51,11 @@ OAUTH2_TOKEN_URL = os.getenv("FRISBII_OAUTH2_TOKEN_URL", f"{API_BASE_URL}/oauth/
 OAUTH2_SCOPE = os.getenv("FRISBII_OAUTH2_SCOPE")
 TOKEN_STORAGE_FILE = os.getenv("FRISBII_TOKEN_STORAGE", "frisbii_oauth_token.json")
 
+# Seconds to cache plan and component catalog responses (0 disables the cache)
+CATALOG_CACHE_TTL = float(os.getenv("FRISBII_CATALOG_CACHE_TTL", "300"))
+# Seconds to cache the registered webhooks list (0 disables the cache)
+WEBHOOK_CACHE_TTL = float(os.getenv("FRISBII_WEBHOOK_CACHE_TTL", "60"))
+
 # Authentication configuration check
 auth_method = None
 if OAUTH2_CLIENT_ID and OAUTH2_CLIENT_SECRET:
@@ -52,50 +72,115 @@ if not LEGAL_ENTITY_ID:
     logger.warning("FRISBII_LEGAL_ENTITY_ID not set - x-selected-legal-entity-id header will be omitted from requests")
 
 # Token storage functions
+
+# Serialized token last read from or written to TOKEN_STORAGE_FILE
+_stored_token_data: Optional[bytes] = None
+
 def save_token(token: Dict[str, Any]) -> None:
     """Save OAuth2 token to file."""
+    global _stored_token_data
     try:
-        with open(TOKEN_STORAGE_FILE, 'w') as f:
-            json.dump(token, f)
-        logger.info("OAuth2 token saved successfully")
+        data = _json_dumps(token)
+        if data == _stored_token_data:
+            return
+        # Write to a temporary file and rename it so the stored token is never partially written
+        tmp_file = TOKEN_STORAGE_FILE + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, TOKEN_STORAGE_FILE)
+        _stored_token_data = data
+        logger.debug("OAuth2 token saved successfully")
     except Exception as e:
         logger.error(f"Failed to save OAuth2 token: {e}")
 
 def load_token() -> Optional[Dict[str, Any]]:
     """Load OAuth2 token from file."""
+    global _stored_token_data
     try:
-        if os.path.exists(TOKEN_STORAGE_FILE):
-            with open(TOKEN_STORAGE_FILE, 'r') as f:
-                token = json.load(f)
-            logger.info("OAuth2 token loaded successfully")
-            return token
+        with open(TOKEN_STORAGE_FILE, 'rb') as f:
+            data = f.read()
+        token = _json_loads(data)
+        _stored_token_data = data
+        logger.debug("OAuth2 token loaded successfully")
+        return token
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.error(f"Failed to load OAuth2 token: {e}")
     return None
 
+def remove_token() -> bool:
+    """Remove the OAuth2 token file. Returns whether a file was removed."""
+    global _stored_token_data
+    _stored_token_data = None
+    try:
+        os.remove(TOKEN_STORAGE_FILE)
+        return True
+    except FileNotFoundError:
+        return False
+
 def is_token_valid(token: Dict[str, Any]) -> bool:
     """Check if OAuth2 token is still valid."""
-    if not token or 'expires_at' not in token:
-        return False
-    
-    expires_at = token.get('expires_at', 0)
     # Add 60 second buffer before expiration
-    return datetime.now().timestamp() < (expires_at - 60)
+    return bool(token) and time.time() < token.get('expires_at', 0) - 60
+
+# In-memory copy of the OAuth2 token; the storage file is only read when it is missing
+_cached_token: Optional[Dict[str, Any]] = None
+_token_lock = threading.Lock()
+
+def _current_token() -> Optional[Dict[str, Any]]:
+    """Get the in-memory OAuth2 token, loading it from file if needed. Call with _token_lock held."""
+    global _cached_token
+    if _cached_token is None:
+        _cached_token = load_token()
+    return _cached_token
 
 # HTTP Client configuration
-def get_oauth2_token() -> Optional[str]:
-    """Get a valid OAuth2 access token."""
+def _get_valid_oauth2_token() -> Optional[Dict[str, Any]]:
+    """Get a valid OAuth2 token, fetching a new one if needed."""
+    global _cached_token
     if not OAUTH2_CLIENT_ID or not OAUTH2_CLIENT_SECRET:
         return None
     
-    # Try to load existing token
-    token = load_token()
+    with _token_lock:
+        # Check if the existing token is valid
+        token = _current_token()
+        if token and is_token_valid(token):
+            return token
+        
+        _cached_token = _fetch_oauth2_token()
+        return _cached_token
+
+# Forced refresh currently talking to the token endpoint, shared by concurrent callers
+_refresh_inflight: Optional[Future] = None
+_refresh_lock = threading.Lock()
+
+def _force_refresh_oauth2_token() -> Optional[Dict[str, Any]]:
+    """Discard the current OAuth2 token and fetch a new one, joining a refresh already in flight."""
+    global _cached_token, _refresh_inflight
+    with _refresh_lock:
+        inflight = _refresh_inflight
+        if inflight is None:
+            _refresh_inflight = Future()
+    if inflight is not None:
+        return inflight.result()
     
-    # Check if token is valid
-    if token and is_token_valid(token):
-        return token.get('access_token')
+    token = None
+    try:
+        with _token_lock:
+            remove_token()
+            _cached_token = token = _fetch_oauth2_token()
+    finally:
+        with _refresh_lock:
+            inflight, _refresh_inflight = _refresh_inflight, None
+        inflight.set_result(token)
+    return token
+
+def _fetch_oauth2_token() -> Optional[Dict[str, Any]]:
+    """Request a new OAuth2 token and save it."""
+    # Imported here so bearer-token deployments never load authlib
+    from authlib.integrations.httpx_client import OAuth2Client
     
-    # Request new token
     try:
         client = OAuth2Client(
             client_id=OAUTH2_CLIENT_ID,
@@ -111,41 +196,186 @@ def get_oauth2_token() -> Optional[str]:
         
         # Add expires_at if not present
         if 'expires_at' not in token and 'expires_in' in token:
-            token['expires_at'] = datetime.now().timestamp() + token['expires_in']
+            token['expires_at'] = time.time() + token['expires_in']
         
+        logger.info("Fetched new OAuth2 token")
         save_token(token)
-        return token.get('access_token')
+        return token
         
     except Exception as e:
         logger.error(f"Failed to fetch OAuth2 token: {e}")
         return None
 
-def get_client() -> httpx.Client:
-    """Get configured HTTP client with authentication headers."""
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
-    # Add legal entity ID header only if provided
-    if LEGAL_ENTITY_ID:
-        headers["x-selected-legal-entity-id"] = LEGAL_ENTITY_ID
+def get_oauth2_token() -> Optional[str]:
+    """Get a valid OAuth2 access token."""
+    token = _get_valid_oauth2_token()
+    return token.get('access_token') if token else None
+
+def _oauth2_credentials() -> Tuple[str, float]:
+    """Get an OAuth2 access token and its expiry timestamp."""
+    token = _get_valid_oauth2_token()
+    if not token or not token.get('access_token'):
+        logger.error("Failed to obtain OAuth2 token")
+        raise Exception("Authentication failed: Unable to obtain OAuth2 token")
+    return token['access_token'], token.get('expires_at', 0)
+
+def _bearer_credentials() -> Tuple[str, float]:
+    """Get the configured API key, which never expires."""
+    return API_KEY, float("inf")
+
+def _no_credentials() -> Tuple[str, float]:
+    """Fail requests when no authentication method is configured."""
+    logger.error("No valid authentication method available")
+    raise Exception("Authentication failed: No valid credentials configured")
+
+# Credentials source for the configured authentication method, chosen once at startup
+_load_credentials = (
+    _oauth2_credentials if auth_method == "oauth2"
+    else _bearer_credentials if auth_method == "bearer"
+    else _no_credentials
+)
+
+class FrisbiiAuth(httpx.Auth):
+    """Bearer authentication that keeps the current Authorization header in memory."""
+
+    def __init__(self) -> None:
+        # Built once per token rather than once per request
+        self._header: Optional[str] = None
+        self._exp = 0.0
+
+    def invalidate(self) -> None:
+        """Drop the cached token so the next request fetches a new one."""
+        self._header = None
+        self._exp = 0.0
+
+    def _is_fresh(self) -> bool:
+        # Add 60 second buffer before expiration
+        return self._header is not None and time.monotonic() < self._exp - 60
+
+    def _refresh(self) -> None:
+        """Obtain a token for the configured authentication method."""
+        token, expires_at = _load_credentials()
+        self._header = f"Bearer {token}"
+        # Convert the wall-clock expiry into the monotonic clock
+        self._exp = time.monotonic() + expires_at - time.time()
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        if not self._is_fresh():
+            self._refresh()
+        request.headers["Authorization"] = self._header
+        yield request
+
+    async def async_auth_flow(self, request: httpx.Request) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        if not self._is_fresh():
+            # Token loading and fetching block, so keep them off the event loop
+            await asyncio.to_thread(self._refresh)
+        request.headers["Authorization"] = self._header
+        yield request
+
+# Default headers sent with every request
+_BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+}
+
+# Add legal entity ID header only if provided
+if LEGAL_ENTITY_ID:
+    _BASE_HEADERS["x-selected-legal-entity-id"] = LEGAL_ENTITY_ID
+
+# Shared HTTP client, created lazily and reused so connections stay alive across tool calls
+_client: Optional[httpx.AsyncClient] = None
+_auth = FrisbiiAuth()
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            headers=_BASE_HEADERS,
+            auth=_auth,
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=100)
+        )
+    return _client
+
+def _check(response: httpx.Response) -> None:
+    """Raise for HTTP errors, only entering raise_for_status() when the status is not 2xx."""
+    if not 200 <= response.status_code < 300:
+        response.raise_for_status()
+
+def _decode(response: httpx.Response) -> Any:
+    """Raise for HTTP errors and decode the JSON body, if there is one."""
+    _check(response)
+    if response.status_code == 204 or not response.content:
+        return None
+    return _json_loads(response.content)
+
+def _fields(*pairs: Tuple[str, Any]) -> Dict[str, Any]:
+    """Build query parameters or a request body from optional (name, value) pairs, dropping unset values."""
+    # Empty strings count as unset, but False and 0 are real values
+    return {name: value for name, value in pairs if value is not None and value != ""}
+
+# Query parameters as a dict or as pre-built (name, value) pairs
+QueryParams = Union[Dict[str, Any], List[Tuple[str, Any]]]
+
+# Responses of rarely changing endpoints (plans, components, webhooks), keyed by path and query
+_response_cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[float, Any]] = {}
+_RESPONSE_CACHE_SIZE = 256
+
+async def _get_json(path: str, params: Optional[QueryParams] = None, ttl: float = 0) -> Any:
+    """Fetch a path and decode the response, serving it from the cache for ttl seconds when ttl > 0."""
+    if ttl <= 0:
+        return _decode(await _get_shared_client().get(path, params=params))
     
-    # Choose authentication method
-    if auth_method == "oauth2":
-        access_token = get_oauth2_token()
-        if access_token:
-            headers["Authorization"] = f"Bearer {access_token}"
-        else:
-            logger.error("Failed to obtain OAuth2 token")
-            raise Exception("Authentication failed: Unable to obtain OAuth2 token")
-    elif auth_method == "bearer" and API_KEY:
-        headers["Authorization"] = f"Bearer {API_KEY}"
-    else:
-        logger.error("No valid authentication method available")
-        raise Exception("Authentication failed: No valid credentials configured")
+    pairs = params.items() if isinstance(params, dict) else params or ()
+    cache_key = (path, tuple(sorted(pairs)))
+    entry = _response_cache.get(cache_key)
+    now = time.monotonic()
+    if entry and entry[0] > now:
+        return entry[1]
     
-    return httpx.Client(base_url=API_BASE_URL, headers=headers, timeout=30.0)
+    data = _decode(await _get_shared_client().get(path, params=params))
+    _response_cache.pop(cache_key, None)
+    if len(_response_cache) >= _RESPONSE_CACHE_SIZE:
+        # Evict the oldest entry
+        del _response_cache[next(iter(_response_cache))]
+    _response_cache[cache_key] = (now + ttl, data)
+    return data
+
+def _invalidate_cache(path: str) -> int:
+    """Drop all cached responses for a path and return how many were removed."""
+    keys = [key for key in _response_cache if key[0] == path]
+    for key in keys:
+        del _response_cache[key]
+    return len(keys)
+
+async def _get_list(path: str, key: str, params: Optional[QueryParams] = None, ttl: float = 0) -> Dict[str, Any]:
+    """Fetch a list endpoint and wrap list responses as {key: items, "count": n}."""
+    # An empty or 204 response means there are no items
+    data = await _get_json(path, params, ttl) or []
+    # Ensure we return a dict structure for MCP compatibility
+    return {key: data, "count": len(data)} if isinstance(data, list) else data
+
+async def _get_item(path: str, key: str, ttl: float = 0) -> Dict[str, Any]:
+    """Fetch a single resource and wrap it as {key: item}."""
+    # Always return a dict with a key for MCP compatibility
+    return {key: await _get_json(path, ttl=ttl)}
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared HTTP client when the server shuts down."""
+    global _client
+    try:
+        yield
+    finally:
+        if _client is not None:
+            await _client.aclose()
+            _client = None
+
+# Create FastMCP instance
+mcp = FastMCP("Frisbii Transform", lifespan=_lifespan)
 
 # Pydantic models for request/response validation
 class CustomerCreate(BaseModel):
@@ -178,7 +408,7 @@ class MeteredUsageCreate(BaseModel):
 # Customer Management Tools
 
 @mcp.tool()
-def get_customers(
+async def get_customers(
     search: Optional[str] = None,
     status_filter: Optional[str] = None,
     from_cursor: Optional[str] = None,
@@ -193,55 +423,39 @@ def get_customers(
         from_cursor: Cursor for pagination
         take: Number of customers to return (max 500)
     """
-    with get_client() as client:
-        params: Dict[str, Any] = {"take": take}
-        if search:
-            params["search"] = search
-        if status_filter:
-            params["statusFilter"] = status_filter
-        if from_cursor:
-            params["from"] = from_cursor
-            
-        response = client.get("/api/v1/customers", params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Ensure we return a dict structure for MCP compatibility
-        if isinstance(data, list):
-            return {"customers": data, "count": len(data)}
-        return data
+    params = _fields(
+        ("take", take),
+        ("search", search),
+        ("statusFilter", status_filter),
+        ("from", from_cursor)
+    )
+    return await _get_list("/api/v1/customers", "customers", params)
 
 @mcp.tool()
-def get_customer(customer_id: str) -> Dict[str, Any]:
+async def get_customer(customer_id: str) -> Dict[str, Any]:
     """
     Retrieve a specific customer by ID.
     
     Args:
         customer_id: The customer's unique identifier
     """
-    with get_client() as client:
-        response = client.get(f"/api/v1/customers/{customer_id}")
-        response.raise_for_status()
-        data = response.json()
-        # Always return a dict with a key for MCP compatibility
-        return {"customer": data}
+    return await _get_item(f"/api/v1/customers/{customer_id}", "customer")
 
 @mcp.tool()
-def create_customer(customer_data: CustomerCreate) -> Dict[str, Any]:
+async def create_customer(customer_data: CustomerCreate) -> Dict[str, Any]:
     """
     Create a new customer.
     
     Args:
         customer_data: Customer information including name, email, and other details
     """
-    with get_client() as client:
-        response = client.post("/api/v1/customers", json=customer_data.model_dump())
-        response.raise_for_status()
-        data = response.json()
-        return {"customer": data}
+    client = _get_shared_client()
+    response = await client.post("/api/v1/customers", content=customer_data.model_dump_json(exclude_none=True))
+    data = _decode(response)
+    return {"customer": data}
 
 @mcp.tool()
-def update_customer(customer_id: str, customer_data: CustomerCreate) -> Dict[str, Any]:
+async def update_customer(customer_id: str, customer_data: CustomerCreate) -> Dict[str, Any]:
     """
     Update an existing customer.
     
@@ -249,29 +463,28 @@ def update_customer(customer_id: str, customer_data: CustomerCreate) -> Dict[str
         customer_id: The customer's unique identifier
         customer_data: Updated customer information
     """
-    with get_client() as client:
-        response = client.put(f"/api/v1/customers/{customer_id}", json=customer_data.model_dump())
-        response.raise_for_status()
-        data = response.json()
-        return {"customer": data}
+    client = _get_shared_client()
+    response = await client.put(f"/api/v1/customers/{customer_id}", content=customer_data.model_dump_json(exclude_none=True))
+    data = _decode(response)
+    return {"customer": data}
 
 @mcp.tool()
-def delete_customer(customer_id: str) -> Dict[str, Any]:
+async def delete_customer(customer_id: str) -> Dict[str, Any]:
     """
     Delete a customer (GDPR compliant).
     
     Args:
         customer_id: The customer's unique identifier
     """
-    with get_client() as client:
-        response = client.delete(f"/api/v1/customers/{customer_id}")
-        response.raise_for_status()
-        return {"message": "Customer deleted successfully"}
+    client = _get_shared_client()
+    response = await client.delete(f"/api/v1/customers/{customer_id}")
+    _check(response)
+    return {"message": "Customer deleted successfully"}
 
 # Contract Management Tools
 
 @mcp.tool()
-def get_contracts(
+async def get_contracts(
     from_cursor: Optional[str] = None,
     take: int = 50,
     external_id: Optional[str] = None
@@ -284,54 +497,35 @@ def get_contracts(
         take: Number of contracts to return (max 500)
         external_id: Filter by external ID
     """
-    with get_client() as client:
-        params: Dict[str, Any] = {"take": take}
-        if from_cursor:
-            params["from"] = from_cursor
-        if external_id:
-            params["externalId"] = external_id
-            
-        response = client.get("/api/v1/contracts", params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Ensure we return a dict structure for MCP compatibility
-        if isinstance(data, list):
-            return {"contracts": data, "count": len(data)}
-        return data
+    params = _fields(
+        ("take", take),
+        ("from", from_cursor),
+        ("externalId", external_id)
+    )
+    return await _get_list("/api/v1/contracts", "contracts", params)
 
 @mcp.tool()
-def get_contract(contract_id: str) -> Dict[str, Any]:
+async def get_contract(contract_id: str) -> Dict[str, Any]:
     """
     Retrieve a specific contract by ID.
     
     Args:
         contract_id: The contract's unique identifier
     """
-    with get_client() as client:
-        response = client.get(f"/api/v1/contracts/{contract_id}")
-        response.raise_for_status()
-        data = response.json()
-        return {"contract": data}
+    return await _get_item(f"/api/v1/contracts/{contract_id}", "contract")
 
 @mcp.tool()
-def get_contracts_by_customer(customer_id: str) -> Dict[str, Any]:
+async def get_contracts_by_customer(customer_id: str) -> Dict[str, Any]:
     """
     Retrieve all contracts for a specific customer.
     
     Args:
         customer_id: The customer's unique identifier
     """
-    with get_client() as client:
-        response = client.get(f"/api/v1/customers/{customer_id}/contracts")
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"contracts": data, "count": len(data)}
-        return data
+    return await _get_list(f"/api/v1/customers/{customer_id}/contracts", "contracts")
 
 @mcp.tool()
-def cancel_contract(contract_id: str, end_date: Optional[str] = None) -> Dict[str, Any]:
+async def cancel_contract(contract_id: str, end_date: Optional[str] = None) -> Dict[str, Any]:
     """
     Cancel a contract.
     
@@ -339,17 +533,14 @@ def cancel_contract(contract_id: str, end_date: Optional[str] = None) -> Dict[st
         contract_id: The contract's unique identifier
         end_date: Optional end date for the contract (ISO format)
     """
-    with get_client() as client:
-        data = {}
-        if end_date:
-            data["endDate"] = end_date
-        response = client.post(f"/api/v1/contracts/{contract_id}/end", json=data)
-        response.raise_for_status()
-        data = response.json()
-        return {"contract": data}
+    client = _get_shared_client()
+    body = _json_dumps(_fields(("endDate", end_date)))
+    response = await client.post(f"/api/v1/contracts/{contract_id}/end", content=body)
+    data = _decode(response)
+    return {"contract": data}
 
 @mcp.tool()
-def pause_contract(contract_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, Any]:
+async def pause_contract(contract_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, Any]:
     """
     Pause a contract.
     
@@ -358,19 +549,14 @@ def pause_contract(contract_id: str, start_date: Optional[str] = None, end_date:
         start_date: Optional pause start date (ISO format)
         end_date: Optional pause end date (ISO format)
     """
-    with get_client() as client:
-        data = {}
-        if start_date:
-            data["startDate"] = start_date
-        if end_date:
-            data["endDate"] = end_date
-        response = client.post(f"/api/v1/contracts/{contract_id}/pause", json=data)
-        response.raise_for_status()
-        data = response.json()
-        return {"contract": data}
+    client = _get_shared_client()
+    body = _json_dumps(_fields(("startDate", start_date), ("endDate", end_date)))
+    response = await client.post(f"/api/v1/contracts/{contract_id}/pause", content=body)
+    data = _decode(response)
+    return {"contract": data}
 
 @mcp.tool()
-def resume_contract(contract_id: str, resume_date: Optional[str] = None) -> Dict[str, Any]:
+async def resume_contract(contract_id: str, resume_date: Optional[str] = None) -> Dict[str, Any]:
     """
     Resume a paused contract.
     
@@ -378,19 +564,16 @@ def resume_contract(contract_id: str, resume_date: Optional[str] = None) -> Dict
         contract_id: The contract's unique identifier
         resume_date: Optional resume date (ISO format)
     """
-    with get_client() as client:
-        data = {}
-        if resume_date:
-            data["resumeDate"] = resume_date
-        response = client.post(f"/api/v1/contracts/{contract_id}/resume", json=data)
-        response.raise_for_status()
-        data = response.json()
-        return {"contract": data}
+    client = _get_shared_client()
+    body = _json_dumps(_fields(("resumeDate", resume_date)))
+    response = await client.post(f"/api/v1/contracts/{contract_id}/resume", content=body)
+    data = _decode(response)
+    return {"contract": data}
 
 # Component Subscription Tools
 
 @mcp.tool()
-def get_component_subscriptions(
+async def get_component_subscriptions(
     contract_id: Optional[str] = None,
     component_id: Optional[str] = None,
     from_cursor: Optional[str] = None,
@@ -405,39 +588,26 @@ def get_component_subscriptions(
         from_cursor: Cursor for pagination
         take: Number of subscriptions to return (max 500)
     """
-    with get_client() as client:
-        params: Dict[str, Any] = {"take": take}
-        if contract_id:
-            params["contractId"] = contract_id
-        if component_id:
-            params["componentId"] = component_id
-        if from_cursor:
-            params["from"] = from_cursor
-        response = client.get("/api/v1/componentsubscriptions", params=params)
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"component_subscriptions": data, "count": len(data)}
-        return data
+    params = _fields(
+        ("take", take),
+        ("contractId", contract_id),
+        ("componentId", component_id),
+        ("from", from_cursor)
+    )
+    return await _get_list("/api/v1/componentsubscriptions", "component_subscriptions", params)
 
 @mcp.tool()
-def get_contract_component_subscriptions(contract_id: str) -> Dict[str, Any]:
+async def get_contract_component_subscriptions(contract_id: str) -> Dict[str, Any]:
     """
     Retrieve all component subscriptions for a specific contract.
     
     Args:
         contract_id: The contract's unique identifier
     """
-    with get_client() as client:
-        response = client.get(f"/api/v1/contracts/{contract_id}/componentsubscriptions")
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"component_subscriptions": data, "count": len(data)}
-        return data
+    return await _get_list(f"/api/v1/contracts/{contract_id}/componentsubscriptions", "component_subscriptions")
 
 @mcp.tool()
-def create_component_subscription(contract_id: str, subscription_data: ComponentSubscriptionCreate) -> Dict[str, Any]:
+async def create_component_subscription(contract_id: str, subscription_data: ComponentSubscriptionCreate) -> Dict[str, Any]:
     """
     Create a new component subscription for a contract.
     
@@ -445,17 +615,16 @@ def create_component_subscription(contract_id: str, subscription_data: Component
         contract_id: The contract's unique identifier
         subscription_data: Component subscription details
     """
-    with get_client() as client:
-        response = client.post(
-            f"/api/v1/contracts/{contract_id}/componentsubscriptions", 
-            json=subscription_data.model_dump()
-        )
-        response.raise_for_status()
-        data = response.json()
-        return {"component_subscription": data}
+    client = _get_shared_client()
+    response = await client.post(
+        f"/api/v1/contracts/{contract_id}/componentsubscriptions", 
+        content=subscription_data.model_dump_json(exclude_none=True)
+    )
+    data = _decode(response)
+    return {"component_subscription": data}
 
 @mcp.tool()
-def end_component_subscription(
+async def end_component_subscription(
     contract_id: str, 
     subscription_id: str, 
     end_date: Optional[str] = None
@@ -468,22 +637,19 @@ def end_component_subscription(
         subscription_id: The component subscription's unique identifier
         end_date: Optional end date (ISO format)
     """
-    with get_client() as client:
-        data = {}
-        if end_date:
-            data["endDate"] = end_date
-        response = client.post(
-            f"/api/v1/contracts/{contract_id}/componentsubscriptions/{subscription_id}/end",
-            json=data
-        )
-        response.raise_for_status()
-        data = response.json()
-        return {"component_subscription": data}
+    client = _get_shared_client()
+    body = _json_dumps(_fields(("endDate", end_date)))
+    response = await client.post(
+        f"/api/v1/contracts/{contract_id}/componentsubscriptions/{subscription_id}/end",
+        content=body
+    )
+    data = _decode(response)
+    return {"component_subscription": data}
 
 # Usage Tracking Tools
 
 @mcp.tool()
-def get_usage_by_contract(
+async def get_usage_by_contract(
     contract_id: str,
     from_datetime: Optional[str] = None,
     until_datetime: Optional[str] = None,
@@ -500,23 +666,16 @@ def get_usage_by_contract(
         from_cursor: Cursor for pagination
         take: Number of usage records to return (max 500)
     """
-    with get_client() as client:
-        params: Dict[str, Any] = {"take": take}
-        if from_datetime:
-            params["fromDateTime"] = from_datetime
-        if until_datetime:
-            params["untilDateTime"] = until_datetime
-        if from_cursor:
-            params["from"] = from_cursor
-        response = client.get(f"/api/v1/contracts/{contract_id}/usage", params=params)
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"usage": data, "count": len(data)}
-        return data
+    params = _fields(
+        ("take", take),
+        ("fromDateTime", from_datetime),
+        ("untilDateTime", until_datetime),
+        ("from", from_cursor)
+    )
+    return await _get_list(f"/api/v1/contracts/{contract_id}/usage", "usage", params)
 
 @mcp.tool()
-def create_usage_record(contract_id: str, usage_data: MeteredUsageCreate) -> Dict[str, Any]:
+async def create_usage_record(contract_id: str, usage_data: MeteredUsageCreate) -> Dict[str, Any]:
     """
     Create a new metered usage record for a contract.
     
@@ -524,17 +683,16 @@ def create_usage_record(contract_id: str, usage_data: MeteredUsageCreate) -> Dic
         contract_id: The contract's unique identifier
         usage_data: Usage record details
     """
-    with get_client() as client:
-        response = client.post(
-            f"/api/v1/contracts/{contract_id}/usage",
-            json=usage_data.model_dump()
-        )
-        response.raise_for_status()
-        data = response.json()
-        return {"usage_record": data}
+    client = _get_shared_client()
+    response = await client.post(
+        f"/api/v1/contracts/{contract_id}/usage",
+        content=usage_data.model_dump_json(exclude_none=True)
+    )
+    data = _decode(response)
+    return {"usage_record": data}
 
 @mcp.tool()
-def delete_usage_record(contract_id: str, usage_id: str) -> Dict[str, Any]:
+async def delete_usage_record(contract_id: str, usage_id: str) -> Dict[str, Any]:
     """
     Delete a usage record.
     
@@ -542,15 +700,15 @@ def delete_usage_record(contract_id: str, usage_id: str) -> Dict[str, Any]:
         contract_id: The contract's unique identifier
         usage_id: The usage record's unique identifier
     """
-    with get_client() as client:
-        response = client.delete(f"/api/v1/contracts/{contract_id}/usage/{usage_id}")
-        response.raise_for_status()
-        return {"message": "Usage record deleted successfully"}
+    client = _get_shared_client()
+    response = await client.delete(f"/api/v1/contracts/{contract_id}/usage/{usage_id}")
+    _check(response)
+    return {"message": "Usage record deleted successfully"}
 
 # Invoice Management Tools
 
 @mcp.tool()
-def get_invoices(
+async def get_invoices(
     contract_id: Optional[str] = None,
     search: Optional[str] = None,
     from_cursor: Optional[str] = None,
@@ -565,53 +723,41 @@ def get_invoices(
         from_cursor: Cursor for pagination
         take: Number of invoices to return (max 500)
     """
-    with get_client() as client:
-        params: Dict[str, Any] = {"take": take}
-        if contract_id:
-            params["contractId"] = contract_id
-        if search:
-            params["search"] = search
-        if from_cursor:
-            params["from"] = from_cursor
-        response = client.get("/api/v1/invoices", params=params)
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"invoices": data, "count": len(data)}
-        return data
+    params = _fields(
+        ("take", take),
+        ("contractId", contract_id),
+        ("search", search),
+        ("from", from_cursor)
+    )
+    return await _get_list("/api/v1/invoices", "invoices", params)
 
 @mcp.tool()
-def get_invoice(invoice_id: str) -> Dict[str, Any]:
+async def get_invoice(invoice_id: str) -> Dict[str, Any]:
     """
     Retrieve a specific invoice by ID.
     
     Args:
         invoice_id: The invoice's unique identifier
     """
-    with get_client() as client:
-        response = client.get(f"/api/v1/invoices/{invoice_id}")
-        response.raise_for_status()
-        data = response.json()
-        return {"invoice": data}
+    return await _get_item(f"/api/v1/invoices/{invoice_id}", "invoice")
 
 @mcp.tool()
-def bill_contract(contract_id: str) -> Dict[str, Any]:
+async def bill_contract(contract_id: str) -> Dict[str, Any]:
     """
     Execute interim billing for a specific contract.
     
     Args:
         contract_id: The contract's unique identifier
     """
-    with get_client() as client:
-        response = client.post(f"/api/v1/contracts/{contract_id}/bill")
-        response.raise_for_status()
-        data = response.json()
-        return {"billing": data}
+    client = _get_shared_client()
+    response = await client.post(f"/api/v1/contracts/{contract_id}/bill")
+    data = _decode(response)
+    return {"billing": data}
 
 # Plan Management Tools
 
 @mcp.tool()
-def get_plan_groups(
+async def get_plan_groups(
     from_cursor: Optional[str] = None,
     search: Optional[str] = None,
     show_hidden: bool = False,
@@ -626,35 +772,26 @@ def get_plan_groups(
         show_hidden: Include hidden plan groups
         take: Number of plan groups to return (max 500)
     """
-    with get_client() as client:
-        params = {"take": take, "showHidden": show_hidden}
-        if from_cursor:
-            params["from"] = from_cursor
-        if search:
-            params["search"] = search
-        response = client.get("/api/v1/plangroups", params=params)
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"plan_groups": data, "count": len(data)}
-        return data
+    params = _fields(
+        ("take", take),
+        ("showHidden", show_hidden),
+        ("from", from_cursor),
+        ("search", search)
+    )
+    return await _get_list("/api/v1/plangroups", "plan_groups", params, ttl=CATALOG_CACHE_TTL)
 
 @mcp.tool()
-def get_plan_group(plan_group_id: str) -> Dict[str, Any]:
+async def get_plan_group(plan_group_id: str) -> Dict[str, Any]:
     """
     Retrieve a specific plan group by ID.
     
     Args:
         plan_group_id: The plan group's unique identifier
     """
-    with get_client() as client:
-        response = client.get(f"/api/v1/plangroups/{plan_group_id}")
-        response.raise_for_status()
-        data = response.json()
-        return {"plan_group": data}
+    return await _get_item(f"/api/v1/plangroups/{plan_group_id}", "plan_group", ttl=CATALOG_CACHE_TTL)
 
 @mcp.tool()
-def get_plans(
+async def get_plans(
     plan_group_id: Optional[str] = None,
     from_cursor: Optional[str] = None,
     take: int = 50
@@ -667,35 +804,25 @@ def get_plans(
         from_cursor: Cursor for pagination
         take: Number of plans to return (max 500)
     """
-    with get_client() as client:
-        params: Dict[str, Any] = {"take": take}
-        if plan_group_id:
-            params["planGroupId"] = plan_group_id
-        if from_cursor:
-            params["from"] = from_cursor
-        response = client.get("/api/v1/plans", params=params)
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"plans": data, "count": len(data)}
-        return data
+    params = _fields(
+        ("take", take),
+        ("planGroupId", plan_group_id),
+        ("from", from_cursor)
+    )
+    return await _get_list("/api/v1/plans", "plans", params, ttl=CATALOG_CACHE_TTL)
 
 @mcp.tool()
-def get_plan(plan_id: str) -> Dict[str, Any]:
+async def get_plan(plan_id: str) -> Dict[str, Any]:
     """
     Retrieve a specific plan by ID.
     
     Args:
         plan_id: The plan's unique identifier
     """
-    with get_client() as client:
-        response = client.get(f"/api/v1/plans/{plan_id}")
-        response.raise_for_status()
-        data = response.json()
-        return {"plan": data}
+    return await _get_item(f"/api/v1/plans/{plan_id}", "plan", ttl=CATALOG_CACHE_TTL)
 
 @mcp.tool()
-def get_plan_variants(
+async def get_plan_variants(
     plan_id: Optional[str] = None,
     external_id: Optional[str] = None,
     take: int = 50
@@ -708,37 +835,27 @@ def get_plan_variants(
         external_id: Filter by external ID
         take: Number of plan variants to return (max 500)
     """
-    with get_client() as client:
-        params: Dict[str, Any] = {"take": take}
-        if plan_id:
-            params["planId"] = plan_id
-        if external_id:
-            params["externalId"] = external_id
-        response = client.get("/api/v1/planvariants", params=params)
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"plan_variants": data, "count": len(data)}
-        return data
+    params = _fields(
+        ("take", take),
+        ("planId", plan_id),
+        ("externalId", external_id)
+    )
+    return await _get_list("/api/v1/planvariants", "plan_variants", params, ttl=CATALOG_CACHE_TTL)
 
 @mcp.tool()
-def get_plan_variant(plan_variant_id: str) -> Dict[str, Any]:
+async def get_plan_variant(plan_variant_id: str) -> Dict[str, Any]:
     """
     Retrieve a specific plan variant by ID.
     
     Args:
         plan_variant_id: The plan variant's unique identifier
     """
-    with get_client() as client:
-        response = client.get(f"/api/v1/planvariants/{plan_variant_id}")
-        response.raise_for_status()
-        data = response.json()
-        return {"plan_variant": data}
+    return await _get_item(f"/api/v1/planvariants/{plan_variant_id}", "plan_variant", ttl=CATALOG_CACHE_TTL)
 
 # Component Management Tools
 
 @mcp.tool()
-def get_components(
+async def get_components(
     from_cursor: Optional[str] = None,
     take: int = 50
 ) -> Dict[str, Any]:
@@ -749,35 +866,26 @@ def get_components(
         from_cursor: Cursor for pagination
         take: Number of components to return (max 500)
     """
-    with get_client() as client:
-        params: Dict[str, Any] = {"take": take}
-        if from_cursor:
-            params["from"] = from_cursor
-        response = client.get("/api/v1/components", params=params)
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"components": data, "count": len(data)}
-        return data
+    params = _fields(
+        ("take", take),
+        ("from", from_cursor)
+    )
+    return await _get_list("/api/v1/components", "components", params, ttl=CATALOG_CACHE_TTL)
 
 @mcp.tool()
-def get_component(component_id: str) -> Dict[str, Any]:
+async def get_component(component_id: str) -> Dict[str, Any]:
     """
     Retrieve a specific component by ID.
     
     Args:
         component_id: The component's unique identifier
     """
-    with get_client() as client:
-        response = client.get(f"/api/v1/components/{component_id}")
-        response.raise_for_status()
-        data = response.json()
-        return {"component": data}
+    return await _get_item(f"/api/v1/components/{component_id}", "component", ttl=CATALOG_CACHE_TTL)
 
 # Payment and Transaction Tools
 
 @mcp.tool()
-def get_payment_transactions(
+async def get_payment_transactions(
     from_cursor: Optional[str] = None,
     take: int = 50
 ) -> Dict[str, Any]:
@@ -788,33 +896,24 @@ def get_payment_transactions(
         from_cursor: Cursor for pagination
         take: Number of transactions to return (max 500)
     """
-    with get_client() as client:
-        params: Dict[str, Any] = {"take": take}
-        if from_cursor:
-            params["from"] = from_cursor
-        response = client.get("/api/v1/paymenttransactions", params=params)
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"payment_transactions": data, "count": len(data)}
-        return data
+    params = _fields(
+        ("take", take),
+        ("from", from_cursor)
+    )
+    return await _get_list("/api/v1/paymenttransactions", "payment_transactions", params)
 
 @mcp.tool()
-def get_payment_transaction(transaction_id: str) -> Dict[str, Any]:
+async def get_payment_transaction(transaction_id: str) -> Dict[str, Any]:
     """
     Retrieve a specific payment transaction by ID.
     
     Args:
         transaction_id: The transaction's unique identifier
     """
-    with get_client() as client:
-        response = client.get(f"/api/v1/paymenttransactions/{transaction_id}")
-        response.raise_for_status()
-        data = response.json()
-        return {"payment_transaction": data}
+    return await _get_item(f"/api/v1/paymenttransactions/{transaction_id}", "payment_transaction")
 
 @mcp.tool()
-def record_contract_payment(
+async def record_contract_payment(
     contract_id: str,
     amount: float,
     currency: str,
@@ -831,23 +930,21 @@ def record_contract_payment(
         description: Payment description
         booking_date: Optional booking date (YYYY-MM-DD format)
     """
-    with get_client() as client:
-        data = {
-            "amount": amount,
-            "currency": currency,
-            "description": description
-        }
-        if booking_date:
-            data["bookingDate"] = booking_date
-        response = client.post(f"/api/v1/contracts/{contract_id}/payment", json=data)
-        response.raise_for_status()
-        data = response.json()
-        return {"payment": data}
+    client = _get_shared_client()
+    body = _json_dumps({
+        "amount": amount,
+        "currency": currency,
+        "description": description,
+        **_fields(("bookingDate", booking_date))
+    })
+    response = await client.post(f"/api/v1/contracts/{contract_id}/payment", content=body)
+    data = _decode(response)
+    return {"payment": data}
 
 # Subscription and Order Tools
 
 @mcp.tool()
-def get_subscriptions(
+async def get_subscriptions(
     show_hidden: bool = False,
     search: Optional[str] = None,
     plan_group_id: Optional[str] = None,
@@ -868,60 +965,41 @@ def get_subscriptions(
         from_cursor: Cursor for pagination
         take: Number of subscriptions to return (max 500)
     """
-    with get_client() as client:
-        params: Dict[str, Any] = {"take": take, "showHidden": show_hidden}
-        if search:
-            params["search"] = search
-        if plan_group_id:
-            params["planGroupId"] = plan_group_id
-        if plan_id:
-            params["planId"] = plan_id
-        if contract_status:
-            params["contractStatus"] = contract_status
-        if from_cursor:
-            params["from"] = from_cursor
-        response = client.get("/api/v1/subscriptions", params=params)
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"subscriptions": data, "count": len(data)}
-        return data
+    params = _fields(
+        ("take", take),
+        ("showHidden", show_hidden),
+        ("search", search),
+        ("planGroupId", plan_group_id),
+        ("planId", plan_id),
+        ("contractStatus", contract_status),
+        ("from", from_cursor)
+    )
+    return await _get_list("/api/v1/subscriptions", "subscriptions", params)
 
 # Reporting Tools
 
 @mcp.tool()
-def get_reports(take: int = 50) -> Dict[str, Any]:
+async def get_reports(take: int = 50) -> Dict[str, Any]:
     """
     Retrieve available reports.
     
     Args:
         take: Number of reports to return (max 500)
     """
-    with get_client() as client:
-        params: Dict[str, Any] = {"take": take}
-        response = client.get("/api/v1/reports", params=params)
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"reports": data, "count": len(data)}
-        return data
+    return await _get_list("/api/v1/reports", "reports", {"take": take})
 
 @mcp.tool()
-def get_report(report_id: str) -> Dict[str, Any]:
+async def get_report(report_id: str) -> Dict[str, Any]:
     """
     Retrieve a specific report by ID.
     
     Args:
         report_id: The report's unique identifier
     """
-    with get_client() as client:
-        response = client.get(f"/api/v1/reports/{report_id}")
-        response.raise_for_status()
-        data = response.json()
-        return {"report": data}
+    return await _get_item(f"/api/v1/reports/{report_id}", "report")
 
 @mcp.tool()
-def generate_report(report_id: str, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+async def generate_report(report_id: str, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Generate a report with optional parameters.
     
@@ -929,30 +1007,92 @@ def generate_report(report_id: str, parameters: Optional[Dict[str, Any]] = None)
         report_id: The report's unique identifier
         parameters: Optional report parameters
     """
-    with get_client() as client:
-        data = parameters or {}
-        response = client.post(f"/api/v1/reports/{report_id}", json=data)
-        response.raise_for_status()
-        data = response.json()
-        return {"report_result": data}
+    client = _get_shared_client()
+    data = parameters or {}
+    response = await client.post(f"/api/v1/reports/{report_id}", content=_json_dumps(data))
+    data = _decode(response)
+    return {"report_result": data}
+
+# Maximum number of reports generate_reports runs at the same time
+_REPORT_CONCURRENCY = 8
+
+@mcp.tool()
+async def generate_reports(report_ids: List[str], parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Generate several reports concurrently with the same optional parameters.
+    
+    Reports that fail are listed under "errors" instead of failing the whole call.
+    
+    Args:
+        report_ids: The reports' unique identifiers
+        parameters: Optional report parameters applied to every report
+    """
+    client = _get_shared_client()
+    body = _json_dumps(parameters or {})
+    # Leave most of the connection pool to other tool calls
+    semaphore = asyncio.Semaphore(_REPORT_CONCURRENCY)
+    
+    async def generate(report_id: str) -> Any:
+        async with semaphore:
+            return _decode(await client.post(f"/api/v1/reports/{report_id}", content=body))
+    
+    outcomes = await asyncio.gather(*(generate(report_id) for report_id in report_ids), return_exceptions=True)
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for report_id, outcome in zip(report_ids, outcomes):
+        if isinstance(outcome, Exception):
+            errors[report_id] = str(outcome)
+        else:
+            results[report_id] = outcome
+    return {"report_results": results, "errors": errors, "count": len(results)}
 
 # Webhook Management Tools
 
 @mcp.tool()
-def get_webhooks() -> Dict[str, Any]:
+async def get_webhooks() -> Dict[str, Any]:
     """
     Retrieve all registered webhooks.
     """
-    with get_client() as client:
-        response = client.get("/api/v1/webhooks")
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"webhooks": data, "count": len(data)}
-        return data
+    # The endpoint always returns an array, so no list check is needed
+    data = await _get_json("/api/v1/webhooks", ttl=WEBHOOK_CACHE_TTL) or []
+    return {"webhooks": data, "count": len(data)}
+
+@mcp.tool()
+async def invalidate_webhooks_cache() -> Dict[str, Any]:
+    """
+    Clear the cached webhooks list so the next get_webhooks call fetches it from the API.
+    """
+    removed = _invalidate_cache("/api/v1/webhooks")
+    return {
+        "success": True,
+        "message": "Webhooks cache cleared" if removed else "Webhooks cache was already empty"
+    }
+
+@lru_cache(maxsize=32)
+def _webhook_event_filters(
+    date_from: Optional[str],
+    date_to: Optional[str],
+    status: Optional[str]
+) -> Tuple[Tuple[str, str], ...]:
+    """Query pairs for the webhook event filters; cached since polling repeats the same filters."""
+    return tuple(_fields(("dateFrom", date_from), ("dateTo", date_to), ("status", status)).items())
+
+def _webhook_event_params(
+    take: int,
+    cursor: Optional[str],
+    date_from: Optional[str],
+    date_to: Optional[str],
+    status: Optional[str]
+) -> List[Tuple[str, Any]]:
+    """Build the webhook event query from the page size, cursor and cached filter pairs."""
+    params: List[Tuple[str, Any]] = [("take", take)]
+    if cursor:
+        params.append(("from", cursor))
+    params.extend(_webhook_event_filters(date_from, date_to, status))
+    return params
 
 @mcp.tool()
-def get_webhook_events(
+async def get_webhook_events(
     from_cursor: Optional[str] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
@@ -969,52 +1109,104 @@ def get_webhook_events(
         status: Filter by event status
         take: Number of events to return (max 500)
     """
-    with get_client() as client:
-        params: Dict[str, Any] = {"take": take}
-        if from_cursor:
-            params["from"] = from_cursor
-        if date_from:
-            params["dateFrom"] = date_from
-        if date_to:
-            params["dateTo"] = date_to
-        if status:
-            params["status"] = status
-        response = client.get("/api/v1/webhookevents", params=params)
-        response.raise_for_status()
-        data = response.json()
-        if isinstance(data, list):
-            return {"webhook_events": data, "count": len(data)}
-        return data
+    params = _webhook_event_params(take, from_cursor, date_from, date_to, status)
+    # The endpoint always returns an array, so no list check is needed
+    data = await _get_json("/api/v1/webhookevents", params) or []
+    return {"webhook_events": data, "count": len(data)}
+
+@mcp.tool()
+async def get_webhook_events_all(
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    status: Optional[str] = None,
+    from_cursor: Optional[str] = None,
+    max_pages: int = 20
+) -> Dict[str, Any]:
+    """
+    Retrieve all webhook events in a date range, following pagination internally.
+    
+    If max_pages is reached before the last page, "truncated" is true and
+    "next_cursor" can be passed as from_cursor to continue where this call stopped.
+    
+    Args:
+        date_from: Filter events from this date (ISO format)
+        date_to: Filter events until this date (ISO format)
+        status: Filter by event status
+        from_cursor: Cursor to resume from, as returned in next_cursor
+        max_pages: Maximum number of 500-event pages to fetch (at least 1)
+    """
+    if max_pages < 1:
+        raise ValueError("max_pages must be at least 1")
+    
+    client = _get_shared_client()
+    take = 500
+    events: List[Dict[str, Any]] = []
+    cursor = from_cursor or None
+    pages = 0
+    truncated = False
+    while True:
+        params = _webhook_event_params(take, cursor, date_from, date_to, status)
+        page = _decode(await client.get("/api/v1/webhookevents", params=params)) or []
+        pages += 1
+        is_last_page = len(page) < take
+        # Skip the cursor event if the API includes it again at the start of the next page
+        if cursor and page and page[0].get("Id") == cursor:
+            page = page[1:]
+        events.extend(page)
+        if is_last_page or not page or not page[-1].get("Id"):
+            break
+        cursor = page[-1]["Id"]
+        if pages >= max_pages:
+            truncated = True
+            break
+    return {
+        "webhook_events": events,
+        "count": len(events),
+        "pages": pages,
+        "truncated": truncated,
+        "next_cursor": cursor if truncated else None
+    }
 
 # OAuth2 Management Tools
 
+@lru_cache(maxsize=1)
+def _expiry_isoformat(expires_at: float) -> str:
+    """Format a token expiry timestamp; cached since it only changes when the token is refreshed."""
+    return datetime.fromtimestamp(expires_at, tz=timezone.utc).isoformat()
+
+# Configuration part of oauth2_status, which cannot change while the server runs
+_STATIC_STATUS = MappingProxyType({
+    "oauth2_configured": bool(OAUTH2_CLIENT_ID and OAUTH2_CLIENT_SECRET),
+    "bearer_token_configured": bool(API_KEY),
+    "legal_entity_id_configured": bool(LEGAL_ENTITY_ID),
+    "legal_entity_id": LEGAL_ENTITY_ID if LEGAL_ENTITY_ID else "Not configured",
+    "current_auth_method": auth_method,
+    "token_storage_file": TOKEN_STORAGE_FILE,
+    "oauth2_token_url": OAUTH2_TOKEN_URL,
+    "oauth2_scope": OAUTH2_SCOPE
+})
+
 @mcp.tool()
-def oauth2_status() -> Dict[str, Any]:
+def oauth2_status(include_iso: bool = False) -> Dict[str, Any]:
     """
     Check OAuth2 authentication status and configuration.
     
     Returns information about the current OAuth2 configuration and token status.
+    
+    Args:
+        include_iso: Also return the token expiry as an ISO 8601 UTC datetime
     """
-    status = {
-        "oauth2_configured": bool(OAUTH2_CLIENT_ID and OAUTH2_CLIENT_SECRET),
-        "bearer_token_configured": bool(API_KEY),
-        "legal_entity_id_configured": bool(LEGAL_ENTITY_ID),
-        "legal_entity_id": LEGAL_ENTITY_ID if LEGAL_ENTITY_ID else "Not configured",
-        "current_auth_method": auth_method,
-        "token_storage_file": TOKEN_STORAGE_FILE,
-        "oauth2_token_url": OAUTH2_TOKEN_URL,
-        "oauth2_scope": OAUTH2_SCOPE
-    }
+    status = dict(_STATIC_STATUS)
     
     if auth_method == "oauth2":
-        token = load_token()
+        with _token_lock:
+            token = _current_token()
         if token:
             status["token_exists"] = True
             status["token_valid"] = is_token_valid(token)
             status["token_expires_at"] = token.get('expires_at')
-            if status["token_expires_at"]:
-                expires_datetime = datetime.fromtimestamp(status["token_expires_at"])
-                status["token_expires_datetime"] = expires_datetime.isoformat()
+            if include_iso and status["token_expires_at"]:
+                status["token_expires_datetime"] = _expiry_isoformat(status["token_expires_at"])
         else:
             status["token_exists"] = False
             status["token_valid"] = False
@@ -1035,14 +1227,11 @@ def oauth2_refresh_token() -> Dict[str, Any]:
         }
     
     try:
-        # Remove existing token file to force refresh
-        if os.path.exists(TOKEN_STORAGE_FILE):
-            os.remove(TOKEN_STORAGE_FILE)
+        # Replace the stored token; concurrent refreshes share a single fetch
+        token = _force_refresh_oauth2_token()
+        _auth.invalidate()
         
-        # Get new token
-        access_token = get_oauth2_token()
-        
-        if access_token:
+        if token and token.get('access_token'):
             return {
                 "success": True,
                 "message": "OAuth2 token refreshed successfully"
@@ -1065,18 +1254,21 @@ def oauth2_clear_token() -> Dict[str, Any]:
     
     This will remove the stored OAuth2 token file, forcing re-authentication on next request.
     """
+    global _cached_token
     try:
-        if os.path.exists(TOKEN_STORAGE_FILE):
-            os.remove(TOKEN_STORAGE_FILE)
-            return {
-                "success": True,
-                "message": "OAuth2 token cleared successfully"
-            }
-        else:
-            return {
-                "success": True,
-                "message": "No OAuth2 token file found"
-            }
+        with _token_lock:
+            _cached_token = None
+            _auth.invalidate()
+            if remove_token():
+                return {
+                    "success": True,
+                    "message": "OAuth2 token cleared successfully"
+                }
+            else:
+                return {
+                    "success": True,
+                    "message": "No OAuth2 token file found"
+                }
     except Exception as e:
         return {
             "success": False,